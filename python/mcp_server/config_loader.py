@@ -1,13 +1,19 @@
 """Configuration management for MCP server"""
 
+import functools
 import os
 import yaml
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class MCPServerConfig:
     """MCP server configuration"""
 
@@ -19,7 +25,7 @@ class MCPServerConfig:
     port: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BackendConfig:
     """Backend worker configuration"""
 
@@ -30,7 +36,7 @@ class BackendConfig:
     comfyui_url: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GenerationConfig:
     """Generation settings"""
 
@@ -45,7 +51,7 @@ class GenerationConfig:
     batch_timeout_s: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeploymentConfig:
     """Bevy deployment configuration"""
 
@@ -56,7 +62,7 @@ class DeploymentConfig:
     validate_bevy_structure: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationConfig:
     """Validation rules"""
 
@@ -70,7 +76,7 @@ class ValidationConfig:
     allowed_styles: List[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     """Complete MCP server configuration"""
 
@@ -87,6 +93,11 @@ class Config:
 def load_config(config_path: Optional[str] = None) -> Config:
     """Load configuration from YAML file
 
+    Results are cached per resolved path, so repeated calls return the same
+    Config instance without re-reading the file. Config objects are frozen;
+    use dataclasses.replace() for variations. Environment overrides are
+    applied on the first load of each path.
+
     Args:
         config_path: Path to config file (defaults to config/mcp_config.yaml)
 
@@ -102,13 +113,17 @@ def load_config(config_path: Optional[str] = None) -> Config:
         project_root = Path(__file__).parent.parent.parent
         config_path = project_root / "config" / "mcp_config.yaml"
 
-    config_path = Path(config_path)
+    return _load_config(Path(config_path).resolve())
+
 
+@functools.lru_cache(maxsize=None)
+def _load_config(config_path: Path) -> Config:
+    """Parse a config file (cached; see load_config)"""
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
     with open(config_path, "r") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_SafeLoader)
 
     # Parse nested configurations
     mcp_server_data = data.get("mcp_server", {})
@@ -202,6 +202,7 @@ async def deploy_to_bevy(
             status: "success" or "error"
             deployed_path: Full path where sprite was deployed
             manifest_updated: Whether manifest was updated
+            manifest: Updated manifest contents (None if not updated)
             error: Error message (if status is "error")
 
     Example:
@@ -41,6 +41,8 @@ class MCPTools:
             zmq_endpoint=config.backend.zmq_endpoint,
             timeout_s=config.backend.timeout_s,
         )
+        # Serializes manifest read-modify-write across concurrent deploys
+        self._manifest_lock = asyncio.Lock()
 
     def _validate_prompt(self, prompt: str) -> None:
         """Validate prompt text
@@ -378,6 +380,47 @@ class MCPTools:
                 "error": f"Batch generation failed: {str(e)}",
             }
 
+    def _update_manifest(
+        self, manifest_path: Path, sprite_entry: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Add or replace a sprite entry in the asset manifest on disk
+
+        Args:
+            manifest_path: Path to the manifest JSON file
+            sprite_entry: Entry to store, keyed by its "name"
+
+        Returns:
+            The updated manifest
+        """
+        manifest = {}
+
+        # Load existing manifest
+        if manifest_path.exists():
+            with open(manifest_path, "r") as f:
+                manifest = json.load(f)
+
+        # Add sprite entry
+        if "sprites" not in manifest:
+            manifest["sprites"] = []
+
+        # Update or append entry
+        existing_idx = None
+        for i, entry in enumerate(manifest["sprites"]):
+            if entry.get("name") == sprite_entry["name"]:
+                existing_idx = i
+                break
+
+        if existing_idx is not None:
+            manifest["sprites"][existing_idx] = sprite_entry
+        else:
+            manifest["sprites"].append(sprite_entry)
+
+        # Write manifest (json.dump would issue one write per token)
+        with open(manifest_path, "w") as f:
+            f.write(json.dumps(manifest, indent=2))
+
+        return manifest
+
     async def deploy_to_bevy(
         self,
         sprite_path: str,
@@ -398,6 +441,7 @@ class MCPTools:
                 status: "success" or "error"
                 deployed_path: Path where sprite was deployed
                 manifest_updated: Whether manifest was updated
+                manifest: Updated manifest contents (None if not updated)
                 error: Error message (if status is "error")
         """
         try:
@@ -426,24 +470,14 @@ class MCPTools:
 
             deployed_path = sprites_dir / filename
 
-            # Copy sprite file
-            shutil.copy2(sprite_path, deployed_path)
+            # Copy sprite file (off the event loop so concurrent deploys overlap)
+            await asyncio.to_thread(shutil.copy2, sprite_path, deployed_path)
 
             # Update manifest if requested
             manifest_updated = False
+            manifest = None
             if update_manifest:
                 manifest_path = bevy_assets_dir / self.config.deployment.manifest_file
-                manifest = {}
-
-                # Load existing manifest
-                if manifest_path.exists():
-                    with open(manifest_path, "r") as f:
-                        manifest = json.load(f)
-
-                # Add sprite entry
-                if "sprites" not in manifest:
-                    manifest["sprites"] = []
-
                 sprite_entry = {
                     "name": sprite_name,
                     "path": str(
@@ -452,21 +486,10 @@ class MCPTools:
                     "deployed_at": time.time(),
                 }
 
-                # Update or append entry
-                existing_idx = None
-                for i, entry in enumerate(manifest["sprites"]):
-                    if entry.get("name") == sprite_name:
-                        existing_idx = i
-                        break
-
-                if existing_idx is not None:
-                    manifest["sprites"][existing_idx] = sprite_entry
-                else:
-                    manifest["sprites"].append(sprite_entry)
-
-                # Write manifest
-                with open(manifest_path, "w") as f:
-                    json.dump(manifest, f, indent=2)
+                async with self._manifest_lock:
+                    manifest = await asyncio.to_thread(
+                        self._update_manifest, manifest_path, sprite_entry
+                    )
 
                 manifest_updated = True
 
@@ -474,6 +497,7 @@ class MCPTools:
                 "status": "success",
                 "deployed_path": str(deployed_path),
                 "manifest_updated": manifest_updated,
+                "manifest": manifest,
             }
 
         except FileNotFoundError as e:
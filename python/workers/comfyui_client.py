@@ -9,6 +9,7 @@ This module provides a client for interacting with the ComfyUI API to:
 
 import json
 import os
+import threading
 import time
 import uuid
 from dataclasses import dataclass
@@ -17,6 +18,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import BaseAdapter
 from requests.exceptions import ConnectionError, RequestException, Timeout
 
 
@@ -27,6 +29,8 @@ from requests.exceptions import ConnectionError, RequestException, Timeout
 DEFAULT_COMFYUI_URL = "http://localhost:8188"
 DEFAULT_TIMEOUT_S = 300
 DEFAULT_POLL_INTERVAL_MS = 100
+DEFAULT_MAX_POLL_INTERVAL_MS = 1000
+POLL_BACKOFF_FACTOR = 1.5
 
 
 # ============================================================================
@@ -34,6 +38,10 @@ DEFAULT_POLL_INTERVAL_MS = 100
 # ============================================================================
 
 
+class WorkflowInterrupted(RuntimeError):
+    """Raised by wait_for_completion() when its prompt is interrupted"""
+
+
 class ExecutionStatus(str, Enum):
     """Workflow execution status"""
 
@@ -88,12 +96,25 @@ class ComfyUIClient:
         base_url: str = DEFAULT_COMFYUI_URL,
         timeout_s: float = DEFAULT_TIMEOUT_S,
         poll_interval_ms: int = DEFAULT_POLL_INTERVAL_MS,
+        max_poll_interval_ms: int = DEFAULT_MAX_POLL_INTERVAL_MS,
+        transport: Optional[BaseAdapter] = None,
     ):
         self.base_url = base_url.rstrip("/")
         self.timeout_s = timeout_s
         self.poll_interval_s = poll_interval_ms / 1000.0
+        self.max_poll_interval_s = max(max_poll_interval_ms / 1000.0, self.poll_interval_s)
         self.session = requests.Session()
 
+        # Custom transport (e.g. an in-memory adapter for tests)
+        if transport is not None:
+            self.session.mount("http://", transport)
+            self.session.mount("https://", transport)
+
+        # Per-prompt events set by interrupt() so that prompt's poll loop
+        # wakes immediately without disturbing other concurrent waits
+        self._cancel_events: Dict[str, threading.Event] = {}
+        self._cancel_lock = threading.Lock()
+
     def health_check(self) -> bool:
         """Check if ComfyUI is accessible"""
         try:
@@ -173,8 +194,23 @@ class ComfyUIClient:
 
         return history.get(prompt_id)
 
-    def interrupt(self) -> None:
-        """Interrupt the current execution"""
+    def interrupt(self, prompt_id: Optional[str] = None) -> None:
+        """Interrupt the current execution
+
+        Args:
+            prompt_id: Prompt whose wait_for_completion() should stop. If
+                omitted, every prompt currently being waited on is woken.
+                A prompt nobody is waiting on is only interrupted in ComfyUI.
+        """
+        with self._cancel_lock:
+            if prompt_id is None:
+                events = list(self._cancel_events.values())
+            else:
+                event = self._cancel_events.get(prompt_id)
+                events = [event] if event is not None else []
+        for event in events:
+            event.set()
+
         try:
             response = self.session.post(f"{self.base_url}/interrupt", timeout=5.0)
             response.raise_for_status()
@@ -190,39 +226,54 @@ class ComfyUIClient:
         Returns:
             Current progress information
         """
-        # Check queue first
+        return self.poll_many([prompt_id])[prompt_id]
+
+    def poll_many(self, prompt_ids: List[str]) -> Dict[str, WorkflowProgress]:
+        """Poll progress for several prompts with a single queue fetch
+
+        The queue response lists every running and pending prompt, so one
+        request answers for all of them. History is only queried for
+        prompts that are no longer queued.
+
+        Args:
+            prompt_ids: The prompt IDs to monitor
+
+        Returns:
+            Mapping of prompt ID to current progress information
+        """
         queue = self.get_queue_status()
 
-        # Check if in running queue
-        running = queue.get("queue_running", [])
-        for item in running:
-            if len(item) >= 2 and item[1] == prompt_id:
-                # Extract progress from item if available
-                return WorkflowProgress(
-                    prompt_id=prompt_id,
-                    status=ExecutionStatus.RUNNING,
-                    current_node=None,
-                    node_name=None,
-                    step=0,
-                    total_steps=0,
-                    percent=0.0,
-                    eta_s=0.0,
+        running = {
+            item[1] for item in queue.get("queue_running", []) if len(item) >= 2
+        }
+        pending = {
+            item[1] for item in queue.get("queue_pending", []) if len(item) >= 2
+        }
+
+        results: Dict[str, WorkflowProgress] = {}
+        for prompt_id in prompt_ids:
+            if prompt_id in running:
+                results[prompt_id] = WorkflowProgress(
+                    prompt_id=prompt_id, status=ExecutionStatus.RUNNING
                 )
-
-        # Check if in pending queue
-        pending = queue.get("queue_pending", [])
-        for item in pending:
-            if len(item) >= 2 and item[1] == prompt_id:
-                return WorkflowProgress(
-                    prompt_id=prompt_id,
-                    status=ExecutionStatus.PENDING,
-                    step=0,
-                    total_steps=0,
-                    percent=0.0,
-                    eta_s=0.0,
+            elif prompt_id in pending:
+                results[prompt_id] = WorkflowProgress(
+                    prompt_id=prompt_id, status=ExecutionStatus.PENDING
                 )
+            else:
+                results[prompt_id] = self._progress_from_history(prompt_id)
+
+        return results
+
+    def _progress_from_history(self, prompt_id: str) -> WorkflowProgress:
+        """Build progress for a prompt that is no longer queued
+
+        Args:
+            prompt_id: The prompt ID to look up
 
-        # Check history for completion
+        Returns:
+            Completed progress if found in history, pending otherwise
+        """
         history = self.get_history(prompt_id)
         if history:
             # Execution completed
@@ -239,14 +290,7 @@ class ComfyUIClient:
             )
 
         # Not found anywhere - still pending
-        return WorkflowProgress(
-            prompt_id=prompt_id,
-            status=ExecutionStatus.PENDING,
-            step=0,
-            total_steps=0,
-            percent=0.0,
-            eta_s=0.0,
-        )
+        return WorkflowProgress(prompt_id=prompt_id, status=ExecutionStatus.PENDING)
 
     def wait_for_completion(
         self,
@@ -262,10 +306,33 @@ class ComfyUIClient:
         Returns:
             Workflow output with images and metadata
 
+        Polling starts at poll_interval_s and backs off geometrically up to
+        max_poll_interval_s, so long generations issue far fewer requests.
+        Calling interrupt(prompt_id) from another thread during the wait
+        cancels it immediately.
+
         Raises:
             TimeoutError: If execution exceeds timeout
+            WorkflowInterrupted: If the prompt is interrupted
             RuntimeError: If execution fails
         """
+        cancel_event = threading.Event()
+        with self._cancel_lock:
+            self._cancel_events[prompt_id] = cancel_event
+        try:
+            return self._poll_until_complete(prompt_id, callback, cancel_event)
+        finally:
+            with self._cancel_lock:
+                self._cancel_events.pop(prompt_id, None)
+
+    def _poll_until_complete(
+        self,
+        prompt_id: str,
+        callback: Optional[callable],
+        cancel_event: threading.Event,
+    ) -> WorkflowOutput:
+        """Poll loop behind wait_for_completion()"""
+        interval = self.poll_interval_s
         start_time = time.time()
 
         while True:
@@ -273,7 +340,7 @@ class ComfyUIClient:
 
             # Check timeout
             if elapsed > self.timeout_s:
-                self.interrupt()
+                self.interrupt(prompt_id)
                 raise TimeoutError(
                     f"Workflow execution exceeded timeout ({self.timeout_s}s)"
                 )
@@ -295,8 +362,11 @@ class ComfyUIClient:
                     error_msg = str(history.get("status", {}).get("messages", error_msg))
                 raise RuntimeError(f"Workflow execution failed: {error_msg}")
 
-            # Wait before next poll
-            time.sleep(self.poll_interval_s)
+            # Wait before next poll, waking early if interrupted
+            remaining = self.timeout_s - (time.time() - start_time)
+            if cancel_event.wait(max(0.0, min(interval, remaining))):
+                raise WorkflowInterrupted("Workflow execution interrupted")
+            interval = min(interval * POLL_BACKOFF_FACTOR, self.max_poll_interval_s)
 
     def _extract_output(self, prompt_id: str, duration_s: float) -> WorkflowOutput:
         """Extract output images from completed workflow
@@ -456,12 +526,14 @@ class ComfyUIClient:
 def create_client(
     url: str = DEFAULT_COMFYUI_URL,
     timeout_s: float = DEFAULT_TIMEOUT_S,
+    transport: Optional[BaseAdapter] = None,
 ) -> ComfyUIClient:
     """Create and validate a ComfyUI client
 
     Args:
         url: ComfyUI server URL
         timeout_s: Request timeout
+        transport: Optional requests transport adapter
 
     Returns:
         Initialized client
@@ -469,7 +541,7 @@ def create_client(
     Raises:
         ConnectionError: If ComfyUI is not accessible
     """
-    client = ComfyUIClient(base_url=url, timeout_s=timeout_s)
+    client = ComfyUIClient(base_url=url, timeout_s=timeout_s, transport=transport)
 
     if not client.health_check():
         raise ConnectionError(f"ComfyUI is not accessible at {url}")
@@ -13,6 +13,8 @@ import threading
 import time
 from typing import Optional
 
+import zmq
+
 try:
     from .zmq_server import ZmqServer
     from .job_queue import JobQueue, JobStatus
@@ -53,9 +55,10 @@ class GenerationWorker:
         req_addr: str = "tcp://127.0.0.1:5555",
         pub_addr: str = "tcp://127.0.0.1:5556",
         executor_config: Optional[ExecutorConfig] = None,
+        context: Optional[zmq.Context] = None,
     ):
         # ZeroMQ server
-        self.zmq_server = ZmqServer(req_addr=req_addr, pub_addr=pub_addr)
+        self.zmq_server = ZmqServer(req_addr=req_addr, pub_addr=pub_addr, context=context)
 
         # Job executor
         if executor_config is None:
@@ -100,6 +103,7 @@ class GenerationWorker:
         print("Shutting down worker...")
 
         self.running = False
+        self.zmq_server.running = False
 
         if self.worker_thread:
             self.worker_thread.join(timeout=5.0)
@@ -16,8 +16,13 @@ from pathlib import Path
 from typing import Callable, Optional
 
 try:
-    from .comfyui_client import ComfyUIClient, WorkflowProgress, create_client
-    from .progress_tracker import ProgressTracker
+    from .comfyui_client import (
+        ComfyUIClient,
+        WorkflowInterrupted,
+        WorkflowProgress,
+        create_client,
+    )
+    from .progress_tracker import JobProgress, ProgressTracker
     from .job_queue import Job, JobStatus
     from .message_protocol import (
         JobStartedUpdate,
@@ -27,8 +32,13 @@ try:
         GenerationStage,
     )
 except ImportError:
-    from comfyui_client import ComfyUIClient, WorkflowProgress, create_client
-    from progress_tracker import ProgressTracker
+    from comfyui_client import (
+        ComfyUIClient,
+        WorkflowInterrupted,
+        WorkflowProgress,
+        create_client,
+    )
+    from progress_tracker import JobProgress, ProgressTracker
     from job_queue import Job, JobStatus
     from message_protocol import (
         JobStartedUpdate,
@@ -130,6 +140,15 @@ class JobExecutor:
                 JobStartedUpdate(job_id=job_id, timestamp=int(time.time()))
             )
 
+            # Cancelled while queued: don't take a ComfyUI queue slot
+            if job_id in self.cancelled_jobs:
+                self.cancelled_jobs.discard(job_id)
+                print(f"[{job_id}] Cancelled before submission")
+                self._publish_update(
+                    JobFinishedUpdate(job_id=job_id, success=False, duration_s=0.0)
+                )
+                return False, None, "Job cancelled"
+
             # Load workflow
             workflow = self._load_workflow(job)
 
@@ -142,21 +161,22 @@ class JobExecutor:
             print(f"[{job_id}] ComfyUI prompt_id: {prompt_id}")
 
             # Start progress tracking
-            self.progress_tracker.start_job(
+            job_progress = self.progress_tracker.start_job(
                 job_id=job_id,
                 prompt_id=prompt_id,
                 total_steps=job.steps,
             )
 
-            # Monitor execution with progress updates
+            # Monitor execution with progress updates. A cancel that lands
+            # before the wait starts is picked up by _handle_progress().
             output = self.client.wait_for_completion(
                 prompt_id=prompt_id,
-                callback=lambda p: self._handle_progress(job_id, p),
+                callback=lambda p: self._handle_progress(job_progress, p),
             )
 
             # Check if job was cancelled during execution
             if job_id in self.cancelled_jobs:
-                self.cancelled_jobs.remove(job_id)
+                self.cancelled_jobs.discard(job_id)
                 return False, None, "Job cancelled"
 
             # Download generated image
@@ -180,6 +200,14 @@ class JobExecutor:
             print(f"[{job_id}] Complete: {output_path} ({output.duration_s:.2f}s)")
             return True, output_path, None
 
+        except WorkflowInterrupted:
+            self.cancelled_jobs.discard(job_id)
+            print(f"[{job_id}] Cancelled")
+            self._publish_update(
+                JobFinishedUpdate(job_id=job_id, success=False, duration_s=0.0)
+            )
+            return False, None, "Job cancelled"
+
         except TimeoutError as e:
             error = f"Timeout: {e}"
             print(f"[{job_id}] {error}")
@@ -204,10 +232,12 @@ class JobExecutor:
         """
         self.cancelled_jobs.add(job_id)
 
-        # Interrupt ComfyUI execution
-        if self.client:
+        # Interrupt ComfyUI execution. A job that has not been submitted yet
+        # is dropped by execute_job() before it reaches ComfyUI.
+        job_progress = self.progress_tracker.active_jobs.get(job_id)
+        if self.client and job_progress is not None:
             try:
-                self.client.interrupt()
+                self.client.interrupt(job_progress.prompt_id)
                 print(f"[{job_id}] Cancellation requested")
             except Exception as e:
                 print(f"[{job_id}] Failed to interrupt: {e}")
@@ -274,23 +304,26 @@ class JobExecutor:
                 break
         return workflow
 
-    def _handle_progress(self, job_id: str, workflow_progress: WorkflowProgress) -> None:
+    def _handle_progress(
+        self, job_progress: JobProgress, workflow_progress: WorkflowProgress
+    ) -> None:
         """Handle progress updates from ComfyUI
 
         Args:
-            job_id: Job identifier
+            job_progress: Tracker state returned by start_job()
             workflow_progress: Progress from ComfyUI
         """
+        job_id = job_progress.job_id
+
         # Check if cancelled
         if job_id in self.cancelled_jobs:
             if self.client:
-                self.client.interrupt()
+                self.client.interrupt(job_progress.prompt_id)
             return
 
         # Update progress tracker
-        stage, step, total_steps, percent, eta_s = self.progress_tracker.update_progress(
-            job_id=job_id,
-            workflow_progress=workflow_progress,
+        stage, step, total_steps, percent, eta_s = self.progress_tracker.update_progress_obj(
+            job_progress, workflow_progress
         )
 
         # Publish progress update
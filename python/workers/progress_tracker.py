@@ -8,8 +8,9 @@ This module provides real-time progress tracking with:
 """
 
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional
 
 try:
     from .message_protocol import GenerationStage
@@ -24,25 +25,32 @@ except ImportError:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class StageTimings:
     """Historical timing data for a generation stage"""
 
     stage: GenerationStage
-    samples: List[float] = field(default_factory=list)
+    samples: Deque[float] = field(default_factory=deque)
     max_samples: int = 100
+    _total: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Bounded window with a running sum, so add/average are O(1)
+        self.samples = deque(self.samples, maxlen=self.max_samples)
+        self._total = sum(self.samples)
 
     def add_sample(self, duration_s: float) -> None:
         """Add a timing sample"""
+        if len(self.samples) == self.max_samples:
+            self._total -= self.samples[0]
         self.samples.append(duration_s)
-        if len(self.samples) > self.max_samples:
-            self.samples.pop(0)
+        self._total += duration_s
 
     def average(self) -> float:
         """Get average duration"""
         if not self.samples:
             return 0.0
-        return sum(self.samples) / len(self.samples)
+        return self._total / len(self.samples)
 
     def estimate(self) -> float:
         """Estimate duration for this stage"""
@@ -61,19 +69,21 @@ class StageTimings:
         return self.average()
 
 
-@dataclass
+@dataclass(slots=True)
 class JobProgress:
     """Detailed progress tracking for a single job"""
 
     job_id: str
     prompt_id: str
     total_steps: int
-    start_time: float = field(default_factory=time.time)
+    # Monotonic timestamps (time.perf_counter_ns), converted to seconds on read.
+    # The clock is looked up per call so tests can substitute a fake one.
+    start_ns: int = field(default_factory=lambda: time.perf_counter_ns())
 
     # Current state
     current_stage: GenerationStage = GenerationStage.INITIALIZING
     current_step: int = 0
-    stage_start_time: float = field(default_factory=time.time)
+    stage_start_ns: int = field(default_factory=lambda: time.perf_counter_ns())
 
     # Stage completion tracking
     completed_stages: List[GenerationStage] = field(default_factory=list)
@@ -83,15 +93,15 @@ class JobProgress:
         if new_stage != self.current_stage:
             self.completed_stages.append(self.current_stage)
             self.current_stage = new_stage
-            self.stage_start_time = time.time()
+            self.stage_start_ns = time.perf_counter_ns()
 
     def elapsed_s(self) -> float:
         """Get total elapsed time"""
-        return time.time() - self.start_time
+        return (time.perf_counter_ns() - self.start_ns) / 1e9
 
     def stage_elapsed_s(self) -> float:
         """Get time spent in current stage"""
-        return time.time() - self.stage_start_time
+        return (time.perf_counter_ns() - self.stage_start_ns) / 1e9
 
 
 # ============================================================================
@@ -167,6 +177,25 @@ class ProgressTracker:
                 0.0,
             )
 
+        return self.update_progress_obj(job, workflow_progress)
+
+    def update_progress_obj(
+        self,
+        job: JobProgress,
+        workflow_progress: WorkflowProgress,
+    ) -> tuple[GenerationStage, int, int, float, float]:
+        """Update progress for a job the caller already holds
+
+        Same as update_progress() without the active_jobs lookup, for callers
+        that kept the JobProgress returned by start_job().
+
+        Args:
+            job: Job progress tracking
+            workflow_progress: Progress from ComfyUI
+
+        Returns:
+            Tuple of (stage, step, total_steps, percent, eta_s)
+        """
         # Map ComfyUI status to our stages
         stage = self._map_status_to_stage(workflow_progress, job)
 
@@ -4,6 +4,7 @@ import time
 import zmq
 import signal
 import sys
+import threading
 from pathlib import Path
 from typing import Optional, List
 
@@ -87,10 +88,16 @@ class ZmqServer:
     MODEL_EXTENSIONS = {".safetensors", ".ckpt", ".pt", ".pth"}
 
     def __init__(
-        self, req_addr: str = DEFAULT_REQ_REP_ADDR, pub_addr: str = DEFAULT_PUB_SUB_ADDR
+        self,
+        req_addr: str = DEFAULT_REQ_REP_ADDR,
+        pub_addr: str = DEFAULT_PUB_SUB_ADDR,
+        context: Optional[zmq.Context] = None,
     ) -> None:
         self.req_addr = req_addr
         self.pub_addr = pub_addr
+        # A caller-supplied context is shared (required for inproc:// endpoints)
+        # and left for the caller to terminate
+        self._shared_context = context
         self.job_queue = JobQueue()
         self.start_time = time.time()
         self.running = False
@@ -107,7 +114,7 @@ class ZmqServer:
         print(f"PUB-SUB endpoint: {self.pub_addr}")
 
         # Create ZeroMQ context
-        self.context = zmq.Context()
+        self.context = self._shared_context or zmq.Context()
 
         # Create REP socket
         self.rep_socket = self.context.socket(zmq.REP)
@@ -123,9 +130,10 @@ class ZmqServer:
         print("Server started successfully")
         self.running = True
 
-        # Setup signal handlers
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        # Setup signal handlers (only possible from the main thread)
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self._signal_handler)
+            signal.signal(signal.SIGTERM, self._signal_handler)
 
         # Main loop
         self._run_loop()
@@ -342,7 +350,7 @@ class ZmqServer:
             self.rep_socket.close()
         if self.pub_socket:
             self.pub_socket.close()
-        if self.context:
+        if self.context and self.context is not self._shared_context:
             self.context.term()
 
         print("Server stopped")
@@ -1,13 +1,8 @@
 """Integration tests for ZeroMQ IPC between Rust and Python"""
 
-import sys
-import os
 import time
 import threading
 
-# Add python directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../python"))
-
 import zmq
 from workers.message_protocol import (
     GenerateRequest,
@@ -56,7 +51,7 @@ def test_server_ping():
         response_data = socket.recv()
         response = deserialize_response(response_data)
 
-        assert response.to_dict()["type"] == "pong"
+        assert response.type == "pong"
 
         socket.close()
         context.term()
@@ -96,7 +91,7 @@ def test_server_status():
         response_data = socket.recv()
         response = deserialize_response(response_data)
 
-        assert response.to_dict()["type"] == "status_info"
+        assert response.type == "status_info"
         assert "version" in response.to_dict()
         assert "queue_size" in response.to_dict()
 
@@ -1,10 +1,6 @@
 """Tests for message protocol serialization/deserialization"""
 
-import sys
-import os
-
-# Add python directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../python"))
+import pytest
 
 from workers.message_protocol import (
     # Requests
@@ -204,6 +200,51 @@ def test_serialize_model_list_response():
     assert deserialized.models[1].model_type == ModelType.LORA
 
 
+def test_deserialize_from_memoryview():
+    """Test decoding directly from a buffer without copying to bytes"""
+    resp = ModelListResponse(
+        models=[
+            ModelInfo(
+                name="SDXL Base",
+                path="/models/sdxl-base.safetensors",
+                model_type=ModelType.CHECKPOINT,
+                size_mb=6500,
+            ),
+        ]
+    )
+
+    serialized = serialize(resp)
+    buf = bytearray(serialized) + bytearray(16)  # Oversized receive buffer
+    view = memoryview(buf)[: len(serialized)]
+
+    assert deserialize_response(view) == deserialize_response(serialized)
+    assert deserialize_request(memoryview(serialize(PingRequest()))) == PingRequest()
+
+
+def test_message_type_property():
+    """Test .type exposes the wire tag without building a dict"""
+    messages = [
+        PingRequest(),
+        CancelRequest(job_id="job-001"),
+        PongResponse(),
+        JobStartedUpdate(job_id="job-001", timestamp=1),
+    ]
+
+    for message in messages:
+        assert message.type == message.to_dict()["type"]
+
+    assert deserialize_response(serialize(PongResponse())).type == "pong"
+
+
+def test_deserialize_unknown_type():
+    """Test unknown or mistyped messages raise ValueError"""
+    with pytest.raises(ValueError):
+        deserialize_request(serialize(PongResponse()))
+
+    with pytest.raises(ValueError):
+        deserialize_update(serialize(CancelRequest(job_id="job-001")))
+
+
 def test_serialize_status_info_response():
     """Test serialization of status info response"""
     resp = StatusInfoResponse(version="1.0.0", queue_size=3, active_jobs=1, uptime_s=3600)
@@ -274,6 +315,7 @@ def test_serialize_progress_update():
     assert deserialized.eta_s == update.eta_s
 
 
+
 def test_serialize_preview_update():
     """Test serialization of preview update"""
     update = PreviewUpdate(job_id="job-001", image_path="/tmp/preview-001.png", step=10)
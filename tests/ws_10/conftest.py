@@ -0,0 +1,56 @@
+"""Pytest configuration for WS-10 backend worker tests
+
+Integration tests that need a live ComfyUI are marked ``requires_comfyui``.
+ComfyUI is probed lazily, at most once per session, and only when such a
+test survives selection, so unit-only runs never touch the network.
+
+ZeroMQ tests share one session-wide context and only create sockets per test.
+"""
+
+import functools
+import socket
+
+import pytest
+import zmq
+
+COMFYUI_HOST = "127.0.0.1"
+COMFYUI_PORT = 8188
+COMFYUI_PROBE_TIMEOUT_S = 0.2
+
+
+@functools.lru_cache(maxsize=None)
+def comfyui_reachable() -> bool:
+    """Check whether something is listening on the ComfyUI port"""
+    try:
+        with socket.create_connection((COMFYUI_HOST, COMFYUI_PORT), COMFYUI_PROBE_TIMEOUT_S):
+            return True
+    except OSError:
+        return False
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "requires_comfyui: test needs ComfyUI running at localhost:8188"
+    )
+    # Provided by pytest-xdist when installed; registered so plain runs don't warn
+    config.addinivalue_line("markers", "xdist_group(name): run tests in one xdist worker")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """Skip ComfyUI tests when it is down (runs after -k/-m deselection)"""
+    marked = [item for item in items if item.get_closest_marker("requires_comfyui")]
+    if not marked or comfyui_reachable():
+        return
+
+    skip = pytest.mark.skip(reason="ComfyUI not available at localhost:8188")
+    for item in marked:
+        item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def zmq_context():
+    """One ZeroMQ context for the whole session; tests create their own sockets"""
+    context = zmq.Context.instance()
+    yield context
+    context.term()
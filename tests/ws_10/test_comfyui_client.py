@@ -1,27 +1,106 @@
 """Tests for ComfyUI client integration"""
 
+import io
 import json
+import threading
+import time
 import pytest
-import responses
 from unittest.mock import Mock, patch
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../python/workers'))
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from urllib3 import HTTPResponse
 
 from comfyui_client import (
     ComfyUIClient,
     ExecutionStatus,
+    WorkflowInterrupted,
     WorkflowProgress,
     WorkflowOutput,
     create_client,
 )
 
 
+# Module-level alias: MockTransport.add takes a `json=` keyword like requests
+_json_dumps = json.dumps
+
+
+# Payloads shared across tests, encoded once at import
+PROMPT_ID = "test-123"
+QUEUE_RUNNING_BYTES = json.dumps(
+    {"queue_running": [[1, PROMPT_ID]], "queue_pending": []}
+).encode()
+QUEUE_EMPTY_BYTES = json.dumps({"queue_running": [], "queue_pending": []}).encode()
+HISTORY_SUCCESS_BYTES = json.dumps(
+    {
+        PROMPT_ID: {
+            "outputs": {
+                "7": {
+                    "images": [
+                        {"filename": "test.png", "subfolder": "", "type": "output"}
+                    ]
+                }
+            }
+        }
+    }
+).encode()
+
+
+class MockTransport(HTTPAdapter):
+    """In-memory transport adapter with a per-test route table
+
+    Routes are keyed on (method, url). Several routes for the same key are
+    served in order, the last one repeating. Unrouted requests raise a
+    connection error, as if ComfyUI were down.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.routes = {}
+        self.calls = []
+
+    def add(
+        self,
+        method,
+        url,
+        json=None,
+        body=b"",
+        status=200,
+        content_type="application/octet-stream",
+    ):
+        """Register a canned response"""
+        if json is not None:
+            body = _json_dumps(json).encode()
+            content_type = "application/json"
+        self.routes.setdefault((method, url), []).append((status, body, content_type))
+
+    def send(self, request, **kwargs):
+        self.calls.append(request)
+
+        queue = self.routes.get((request.method, request.url))
+        if not queue:
+            raise RequestsConnectionError(f"No route for {request.method} {request.url}")
+
+        status, body, content_type = queue.pop(0) if len(queue) > 1 else queue[0]
+        raw = HTTPResponse(
+            body=io.BytesIO(body),
+            status=status,
+            headers={"Content-Type": content_type},
+            preload_content=False,
+        )
+        return self.build_response(request, raw)
+
+
 @pytest.fixture
-def client():
+def transport():
+    """Create an empty mock transport"""
+    return MockTransport()
+
+
+@pytest.fixture
+def client(transport):
     """Create a test client"""
-    return ComfyUIClient(base_url="http://localhost:8188")
+    return ComfyUIClient(base_url="http://localhost:8188", transport=transport)
 
 
 @pytest.fixture
@@ -43,11 +122,10 @@ def sample_workflow():
 class TestComfyUIClient:
     """Test ComfyUI client functionality"""
 
-    @responses.activate
-    def test_health_check_success(self, client):
+    def test_health_check_success(self, client, transport):
         """Test successful health check"""
-        responses.add(
-            responses.GET,
+        transport.add(
+            "GET",
             "http://localhost:8188/system_stats",
             json={"system": {"ram": 128000}},
             status=200,
@@ -60,13 +138,12 @@ class TestComfyUIClient:
         # No response mocked - should fail
         assert client.health_check() is False
 
-    @responses.activate
-    def test_queue_prompt_success(self, client, sample_workflow):
+    def test_queue_prompt_success(self, client, transport, sample_workflow):
         """Test successful prompt queuing"""
         prompt_id = "test-prompt-123"
 
-        responses.add(
-            responses.POST,
+        transport.add(
+            "POST",
             "http://localhost:8188/prompt",
             json={"prompt_id": prompt_id},
             status=200,
@@ -75,11 +152,10 @@ class TestComfyUIClient:
         result = client.queue_prompt(sample_workflow)
         assert result == prompt_id
 
-    @responses.activate
-    def test_queue_prompt_no_id(self, client, sample_workflow):
+    def test_queue_prompt_no_id(self, client, transport, sample_workflow):
         """Test prompt queue without ID returned"""
-        responses.add(
-            responses.POST,
+        transport.add(
+            "POST",
             "http://localhost:8188/prompt",
             json={"status": "ok"},
             status=200,
@@ -88,16 +164,15 @@ class TestComfyUIClient:
         with pytest.raises(ValueError, match="No prompt_id"):
             client.queue_prompt(sample_workflow)
 
-    @responses.activate
-    def test_get_queue_status(self, client):
+    def test_get_queue_status(self, client, transport):
         """Test queue status retrieval"""
         queue_data = {
             "queue_running": [["1", "prompt-123"]],
             "queue_pending": [],
         }
 
-        responses.add(
-            responses.GET,
+        transport.add(
+            "GET",
             "http://localhost:8188/queue",
             json=queue_data,
             status=200,
@@ -106,10 +181,9 @@ class TestComfyUIClient:
         result = client.get_queue_status()
         assert result == queue_data
 
-    @responses.activate
-    def test_get_history_found(self, client):
+    def test_get_history_found(self, client, transport):
         """Test history retrieval when prompt exists"""
-        prompt_id = "test-123"
+        prompt_id = PROMPT_ID
         history_data = {
             prompt_id: {
                 "outputs": {"7": {"images": [{"filename": "test.png"}]}},
@@ -117,8 +191,8 @@ class TestComfyUIClient:
             }
         }
 
-        responses.add(
-            responses.GET,
+        transport.add(
+            "GET",
             f"http://localhost:8188/history/{prompt_id}",
             json=history_data,
             status=200,
@@ -127,13 +201,12 @@ class TestComfyUIClient:
         result = client.get_history(prompt_id)
         assert result == history_data[prompt_id]
 
-    @responses.activate
-    def test_get_history_not_found(self, client):
+    def test_get_history_not_found(self, client, transport):
         """Test history retrieval when prompt doesn't exist"""
         prompt_id = "nonexistent"
 
-        responses.add(
-            responses.GET,
+        transport.add(
+            "GET",
             f"http://localhost:8188/history/{prompt_id}",
             status=404,
         )
@@ -141,11 +214,10 @@ class TestComfyUIClient:
         result = client.get_history(prompt_id)
         assert result is None
 
-    @responses.activate
-    def test_interrupt(self, client):
+    def test_interrupt(self, client, transport):
         """Test execution interruption"""
-        responses.add(
-            responses.POST,
+        transport.add(
+            "POST",
             "http://localhost:8188/interrupt",
             status=200,
         )
@@ -153,15 +225,15 @@ class TestComfyUIClient:
         # Should not raise
         client.interrupt()
 
-    @responses.activate
-    def test_poll_progress_running(self, client):
+    def test_poll_progress_running(self, client, transport):
         """Test progress polling for running job"""
-        prompt_id = "test-123"
+        prompt_id = PROMPT_ID
 
-        responses.add(
-            responses.GET,
+        transport.add(
+            "GET",
             "http://localhost:8188/queue",
-            json={"queue_running": [[1, prompt_id]], "queue_pending": []},
+            body=QUEUE_RUNNING_BYTES,
+            content_type="application/json",
             status=200,
         )
 
@@ -169,13 +241,12 @@ class TestComfyUIClient:
         assert progress.prompt_id == prompt_id
         assert progress.status == ExecutionStatus.RUNNING
 
-    @responses.activate
-    def test_poll_progress_pending(self, client):
+    def test_poll_progress_pending(self, client, transport):
         """Test progress polling for pending job"""
-        prompt_id = "test-123"
+        prompt_id = PROMPT_ID
 
-        responses.add(
-            responses.GET,
+        transport.add(
+            "GET",
             "http://localhost:8188/queue",
             json={"queue_running": [], "queue_pending": [[1, prompt_id]]},
             status=200,
@@ -185,28 +256,25 @@ class TestComfyUIClient:
         assert progress.prompt_id == prompt_id
         assert progress.status == ExecutionStatus.PENDING
 
-    @responses.activate
-    def test_poll_progress_completed(self, client):
+    def test_poll_progress_completed(self, client, transport):
         """Test progress polling for completed job"""
-        prompt_id = "test-123"
+        prompt_id = PROMPT_ID
 
         # Not in queue
-        responses.add(
-            responses.GET,
+        transport.add(
+            "GET",
             "http://localhost:8188/queue",
-            json={"queue_running": [], "queue_pending": []},
+            body=QUEUE_EMPTY_BYTES,
+            content_type="application/json",
             status=200,
         )
 
         # Found in history
-        responses.add(
-            responses.GET,
+        transport.add(
+            "GET",
             f"http://localhost:8188/history/{prompt_id}",
-            json={
-                prompt_id: {
-                    "outputs": {"7": {"images": [{"filename": "test.png"}]}},
-                }
-            },
+            body=HISTORY_SUCCESS_BYTES,
+            content_type="application/json",
             status=200,
         )
 
@@ -214,6 +282,32 @@ class TestComfyUIClient:
         assert progress.prompt_id == prompt_id
         assert progress.status == ExecutionStatus.SUCCESS
 
+    def test_poll_many(self, client, transport):
+        """Test polling several prompts with one queue fetch"""
+        transport.add(
+            "GET",
+            "http://localhost:8188/queue",
+            json={"queue_running": [[1, "run-1"]], "queue_pending": [[2, "pend-1"]]},
+            status=200,
+        )
+
+        # Only the prompt missing from the queue falls through to history
+        transport.add(
+            "GET",
+            "http://localhost:8188/history/done-1",
+            json={"done-1": {"outputs": {"7": {"images": [{"filename": "test.png"}]}}}},
+            status=200,
+        )
+
+        progress = client.poll_many(["run-1", "pend-1", "done-1"])
+
+        assert progress["run-1"].status == ExecutionStatus.RUNNING
+        assert progress["pend-1"].status == ExecutionStatus.PENDING
+        assert progress["done-1"].status == ExecutionStatus.SUCCESS
+
+        queue_calls = [c for c in transport.calls if c.url.endswith("/queue")]
+        assert len(queue_calls) == 1
+
     def test_inject_parameters_prompt(self, client, sample_workflow):
         """Test parameter injection - prompt"""
         result = client.inject_parameters(
@@ -223,6 +317,14 @@ class TestComfyUIClient:
 
         assert result["2"]["inputs"]["text"] == "new prompt"
 
+    def test_inject_parameters_does_not_mutate(self, client, sample_workflow):
+        """Test parameter injection works on an independent copy"""
+        result = client.inject_parameters(sample_workflow, prompt="new prompt")
+
+        assert sample_workflow["2"]["inputs"]["text"] == "test prompt"
+        assert result["1"] is not sample_workflow["1"]
+        assert result["1"]["inputs"] is not sample_workflow["1"]["inputs"]
+
     def test_inject_parameters_steps(self, client):
         """Test parameter injection - steps"""
         workflow = {
@@ -251,14 +353,13 @@ class TestComfyUIClient:
         assert result["4"]["inputs"]["width"] == 1024
         assert result["4"]["inputs"]["height"] == 768
 
-    @responses.activate
-    def test_download_image(self, client, tmp_path):
+    def test_download_image(self, client, transport, tmp_path):
         """Test image download"""
         image_data = b"fake-image-data"
         image_url = "http://localhost:8188/view?filename=test.png"
 
-        responses.add(
-            responses.GET,
+        transport.add(
+            "GET",
             image_url,
             body=image_data,
             status=200,
@@ -283,46 +384,34 @@ class TestComfyUIClient:
 class TestWorkflowExecution:
     """Test full workflow execution flow"""
 
-    @responses.activate
-    def test_wait_for_completion_success(self, client):
+    def test_wait_for_completion_success(self, client, transport):
         """Test successful workflow completion"""
-        prompt_id = "test-123"
+        prompt_id = PROMPT_ID
 
         # Queue status - running
-        responses.add(
-            responses.GET,
+        transport.add(
+            "GET",
             "http://localhost:8188/queue",
-            json={"queue_running": [[1, prompt_id]], "queue_pending": []},
+            body=QUEUE_RUNNING_BYTES,
+            content_type="application/json",
             status=200,
         )
 
         # Queue status - completed (not in queue)
-        responses.add(
-            responses.GET,
+        transport.add(
+            "GET",
             "http://localhost:8188/queue",
-            json={"queue_running": [], "queue_pending": []},
+            body=QUEUE_EMPTY_BYTES,
+            content_type="application/json",
             status=200,
         )
 
         # History - success
-        responses.add(
-            responses.GET,
+        transport.add(
+            "GET",
             f"http://localhost:8188/history/{prompt_id}",
-            json={
-                prompt_id: {
-                    "outputs": {
-                        "7": {
-                            "images": [
-                                {
-                                    "filename": "test.png",
-                                    "subfolder": "",
-                                    "type": "output",
-                                }
-                            ]
-                        }
-                    }
-                }
-            },
+            body=HISTORY_SUCCESS_BYTES,
+            content_type="application/json",
             status=200,
         )
 
@@ -339,23 +428,23 @@ class TestWorkflowExecution:
         assert "test.png" in output.images[0]
         assert len(callback_calls) > 0
 
-    @responses.activate
-    def test_wait_for_completion_timeout(self, client):
+    def test_wait_for_completion_timeout(self, client, transport):
         """Test workflow timeout"""
         client.timeout_s = 0.5  # Very short timeout
-        prompt_id = "test-123"
+        prompt_id = PROMPT_ID
 
         # Always return running
-        responses.add(
-            responses.GET,
+        transport.add(
+            "GET",
             "http://localhost:8188/queue",
-            json={"queue_running": [[1, prompt_id]], "queue_pending": []},
+            body=QUEUE_RUNNING_BYTES,
+            content_type="application/json",
             status=200,
         )
 
         # Mock interrupt
-        responses.add(
-            responses.POST,
+        transport.add(
+            "POST",
             "http://localhost:8188/interrupt",
             status=200,
         )
@@ -363,22 +452,94 @@ class TestWorkflowExecution:
         with pytest.raises(TimeoutError):
             client.wait_for_completion(prompt_id)
 
-    @responses.activate
-    def test_wait_for_completion_error(self, client):
+    def test_wait_for_completion_interrupted(self, client, transport):
+        """Test interrupt() from another thread cancels the wait immediately"""
+        client.poll_interval_s = 5.0  # Long enough that only a wakeup can end it
+        prompt_id = PROMPT_ID
+
+        transport.add(
+            "GET",
+            "http://localhost:8188/queue",
+            body=QUEUE_RUNNING_BYTES,
+            content_type="application/json",
+            status=200,
+        )
+        transport.add(
+            "POST",
+            "http://localhost:8188/interrupt",
+            status=200,
+        )
+
+        timer = threading.Timer(0.1, client.interrupt, args=(prompt_id,))
+        timer.start()
+
+        start = time.monotonic()
+        with pytest.raises(WorkflowInterrupted, match="interrupted"):
+            client.wait_for_completion(prompt_id)
+        timer.join()
+
+        assert time.monotonic() - start < 1.0
+
+    def test_interrupt_targets_one_prompt(self, client, transport):
+        """Test interrupting another prompt leaves this wait running"""
+        client.poll_interval_s = 5.0
+        prompt_id = PROMPT_ID
+
+        transport.add(
+            "GET",
+            "http://localhost:8188/queue",
+            body=QUEUE_RUNNING_BYTES,
+            content_type="application/json",
+            status=200,
+        )
+        transport.add(
+            "POST",
+            "http://localhost:8188/interrupt",
+            status=200,
+        )
+
+        other = threading.Timer(0.1, client.interrupt, args=("other-prompt",))
+        ours = threading.Timer(0.4, client.interrupt, args=(prompt_id,))
+        other.start()
+        ours.start()
+
+        start = time.monotonic()
+        with pytest.raises(WorkflowInterrupted):
+            client.wait_for_completion(prompt_id)
+        other.join()
+        ours.join()
+
+        assert 0.3 < time.monotonic() - start < 1.0
+
+    def test_interrupt_without_wait(self, client, transport):
+        """Test interrupting a prompt nobody waits on leaves no state behind"""
+        transport.add(
+            "POST",
+            "http://localhost:8188/interrupt",
+            status=200,
+        )
+
+        client.interrupt(PROMPT_ID)
+
+        assert client._cancel_events == {}
+        assert len(transport.calls) == 1
+
+    def test_wait_for_completion_error(self, client, transport):
         """Test workflow execution error"""
-        prompt_id = "test-123"
+        prompt_id = PROMPT_ID
 
         # Not in queue
-        responses.add(
-            responses.GET,
+        transport.add(
+            "GET",
             "http://localhost:8188/queue",
-            json={"queue_running": [], "queue_pending": []},
+            body=QUEUE_EMPTY_BYTES,
+            content_type="application/json",
             status=200,
         )
 
         # History shows error
-        responses.add(
-            responses.GET,
+        transport.add(
+            "GET",
             f"http://localhost:8188/history/{prompt_id}",
             json={
                 prompt_id: {
@@ -396,17 +557,16 @@ class TestWorkflowExecution:
 class TestClientCreation:
     """Test client creation utilities"""
 
-    @responses.activate
-    def test_create_client_success(self):
+    def test_create_client_success(self, transport):
         """Test successful client creation"""
-        responses.add(
-            responses.GET,
+        transport.add(
+            "GET",
             "http://localhost:8188/system_stats",
             json={},
             status=200,
         )
 
-        client = create_client()
+        client = create_client(transport=transport)
         assert client is not None
 
     def test_create_client_failure(self):
@@ -0,0 +1,114 @@
+"""Tests for job execution and cancellation"""
+
+import json
+
+import pytest
+
+from comfyui_client import (
+    ExecutionStatus,
+    WorkflowInterrupted,
+    WorkflowOutput,
+    WorkflowProgress,
+)
+from job_executor import ExecutorConfig, JobExecutor
+from job_queue import Job
+from message_protocol import JobFinishedUpdate, JobStartedUpdate
+
+
+PROMPT_ID = "prompt-1"
+
+
+class FakeClient:
+    """Stand-in for ComfyUIClient that records submissions and interrupts
+
+    wait_for_completion() runs the optional on_wait hook, reports one running
+    progress update, then raises WorkflowInterrupted if the prompt was
+    interrupted in the meantime.
+    """
+
+    def __init__(self):
+        self.queued = []
+        self.interrupted = []
+        self.on_wait = None
+
+    def load_workflow(self, path):
+        with open(path) as f:
+            return json.load(f)
+
+    def inject_parameters(self, workflow, **params):
+        return workflow
+
+    def queue_prompt(self, workflow):
+        self.queued.append(workflow)
+        return PROMPT_ID
+
+    def interrupt(self, prompt_id=None):
+        self.interrupted.append(prompt_id)
+
+    def wait_for_completion(self, prompt_id, callback=None):
+        if self.on_wait:
+            self.on_wait()
+        if callback:
+            callback(WorkflowProgress(prompt_id=prompt_id, status=ExecutionStatus.RUNNING))
+        if prompt_id in self.interrupted:
+            raise WorkflowInterrupted("Workflow execution interrupted")
+        return WorkflowOutput(prompt_id=prompt_id, images=[], duration_s=0.0, success=True)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def updates():
+    """Updates published by the executor, in order"""
+    return []
+
+
+@pytest.fixture
+def executor(tmp_path, updates):
+    """Create an executor wired to a fake client and a single workflow"""
+    (tmp_path / "pixel_art_lora.json").write_text(json.dumps({"1": {"inputs": {}}}))
+    config = ExecutorConfig(workflow_dir=str(tmp_path), output_dir=str(tmp_path / "out"))
+    executor = JobExecutor(config, update_callback=updates.append)
+    executor.client = FakeClient()
+    return executor
+
+
+@pytest.fixture
+def job():
+    """Create a test job"""
+    return Job(
+        job_id="job-1",
+        prompt="pixel art knight",
+        model="sdxl",
+        size=[1024, 1024],
+        steps=20,
+        cfg_scale=7.0,
+    )
+
+
+def test_cancel_during_execution(executor, updates, job):
+    """Test a job interrupted while ComfyUI runs it is reported as cancelled"""
+    executor.client.on_wait = lambda: executor.cancel_job(job.job_id)
+
+    result = executor.execute_job(job)
+
+    assert result == (False, None, "Job cancelled")
+    assert PROMPT_ID in executor.client.interrupted
+    assert job.job_id not in executor.cancelled_jobs
+    assert isinstance(updates[-1], JobFinishedUpdate)
+    assert updates[-1].success is False
+
+
+def test_cancel_before_submission(executor, updates, job):
+    """Test a job cancelled while queued never reaches ComfyUI"""
+    executor.cancel_job(job.job_id)
+
+    result = executor.execute_job(job)
+
+    assert result == (False, None, "Job cancelled")
+    assert executor.client.queued == []
+    assert executor.client.interrupted == []
+    assert job.job_id not in executor.cancelled_jobs
+    assert [type(u) for u in updates] == [JobStartedUpdate, JobFinishedUpdate]
+    assert updates[-1].success is False
@@ -1,26 +1,43 @@
 """Tests for progress tracking"""
 
 import pytest
-import time
-
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../python/workers'))
 
+import progress_tracker
 from progress_tracker import ProgressTracker, JobProgress, StageTimings
 from message_protocol import GenerationStage
 from comfyui_client import ExecutionStatus, WorkflowProgress
 
 
+class FakeClock:
+    """Stand-in for the time module with a manually advanced clock"""
+
+    def __init__(self):
+        self.now_ns = 0
+
+    def perf_counter_ns(self):
+        return self.now_ns
+
+    def advance(self, seconds):
+        self.now_ns += int(seconds * 1_000_000_000)
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Replace the progress tracker's clock so tests control elapsed time"""
+    clock = FakeClock()
+    monkeypatch.setattr(progress_tracker, "time", clock)
+    return clock
+
+
 @pytest.fixture
 def tracker():
     """Create a test progress tracker"""
     return ProgressTracker()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_workflow_progress():
-    """Create mock workflow progress"""
+    """Create mock workflow progress (stateless factory, shared per module)"""
     def create_progress(status=ExecutionStatus.RUNNING, step=0, total=20):
         return WorkflowProgress(
             prompt_id="test-prompt",
@@ -53,7 +70,8 @@ class TestStageTimings:
             timings.add_sample(float(i))
 
         assert len(timings.samples) == 3
-        assert timings.samples == [7.0, 8.0, 9.0]  # Last 3 samples
+        assert list(timings.samples) == [7.0, 8.0, 9.0]  # Last 3 samples
+        assert timings.average() == 8.0  # Evicted samples leave the running sum
 
     def test_estimate_no_samples(self):
         """Test estimation with no historical data"""
@@ -89,7 +107,7 @@ class TestJobProgress:
         assert progress.current_step == 0
         assert len(progress.completed_stages) == 0
 
-    def test_update_stage(self):
+    def test_update_stage(self, fake_clock):
         """Test stage updates"""
         progress = JobProgress(
             job_id="test-job",
@@ -97,17 +115,17 @@ class TestJobProgress:
             total_steps=20,
         )
 
-        initial_time = progress.stage_start_time
+        initial_time = progress.stage_start_ns
 
-        time.sleep(0.01)  # Small delay
+        fake_clock.advance(0.01)
 
         progress.update_stage(GenerationStage.LOADING_MODELS)
 
         assert progress.current_stage == GenerationStage.LOADING_MODELS
         assert GenerationStage.INITIALIZING in progress.completed_stages
-        assert progress.stage_start_time > initial_time
+        assert progress.stage_start_ns > initial_time
 
-    def test_elapsed_time(self):
+    def test_elapsed_time(self, fake_clock):
         """Test elapsed time tracking"""
         progress = JobProgress(
             job_id="test-job",
@@ -115,12 +133,12 @@ class TestJobProgress:
             total_steps=20,
         )
 
-        time.sleep(0.1)
+        fake_clock.advance(0.1)
 
         elapsed = progress.elapsed_s()
-        assert elapsed >= 0.1
+        assert elapsed == pytest.approx(0.1)
 
-    def test_stage_elapsed_time(self):
+    def test_stage_elapsed_time(self, fake_clock):
         """Test stage-specific elapsed time"""
         progress = JobProgress(
             job_id="test-job",
@@ -128,13 +146,13 @@ class TestJobProgress:
             total_steps=20,
         )
 
-        time.sleep(0.05)
+        fake_clock.advance(0.05)
         progress.update_stage(GenerationStage.SAMPLING)
-        time.sleep(0.05)
+        fake_clock.advance(0.05)
 
         stage_elapsed = progress.stage_elapsed_s()
-        assert stage_elapsed >= 0.05
-        assert stage_elapsed < progress.elapsed_s()
+        assert stage_elapsed == pytest.approx(0.05)
+        assert progress.elapsed_s() == pytest.approx(0.1)
 
 
 class TestProgressTracker:
@@ -151,7 +169,7 @@ class TestProgressTracker:
         assert progress.job_id == "test-job"
         assert "test-job" in tracker.active_jobs
 
-    def test_update_progress_pending(self, tracker, mock_workflow_progress):
+    def test_update_progress_pending(self, tracker, mock_workflow_progress, fake_clock):
         """Test progress update for pending job"""
         tracker.start_job("test-job", "test-prompt", 20)
 
@@ -183,7 +201,22 @@ class TestProgressTracker:
         assert total == 20
         assert percent > 0.0
 
-    def test_update_progress_stage_transition(self, tracker, mock_workflow_progress):
+    def test_update_progress_obj(self, tracker, mock_workflow_progress, fake_clock):
+        """Test the fast path matches the job_id lookup"""
+        progress = tracker.start_job("test-job", "test-prompt", 20)
+
+        workflow_progress = mock_workflow_progress(
+            status=ExecutionStatus.RUNNING,
+            step=10,
+            total=20,
+        )
+
+        result = tracker.update_progress_obj(progress, workflow_progress)
+
+        assert result == tracker.update_progress("test-job", workflow_progress)
+        assert progress.current_step == 10
+
+    def test_update_progress_stage_transition(self, tracker, mock_workflow_progress, fake_clock):
         """Test stage transition tracking"""
         tracker.start_job("test-job", "test-prompt", 20)
 
@@ -191,7 +224,7 @@ class TestProgressTracker:
         wp1 = mock_workflow_progress(status=ExecutionStatus.PENDING)
         tracker.update_progress("test-job", wp1)
 
-        time.sleep(0.01)
+        fake_clock.advance(0.01)
 
         # Transition to SAMPLING
         wp2 = mock_workflow_progress(status=ExecutionStatus.RUNNING)
@@ -204,7 +237,7 @@ class TestProgressTracker:
 
         # Check timing was recorded
         init_timings = tracker.stage_timings[GenerationStage.INITIALIZING]
-        assert len(init_timings.samples) > 0
+        assert list(init_timings.samples) == [pytest.approx(0.01)]
 
     def test_complete_job(self, tracker):
         """Test job completion"""
@@ -216,7 +249,7 @@ class TestProgressTracker:
 
         assert "test-job" not in tracker.active_jobs
 
-    def test_complete_job_records_timing(self, tracker, mock_workflow_progress):
+    def test_complete_job_records_timing(self, tracker, mock_workflow_progress, fake_clock):
         """Test that completion records final stage timing"""
         tracker.start_job("test-job", "test-prompt", 20)
 
@@ -226,14 +259,14 @@ class TestProgressTracker:
         wp.node_name = "KSampler"
         tracker.update_progress("test-job", wp)
 
-        time.sleep(0.01)
+        fake_clock.advance(0.01)
 
         # Complete job
         tracker.complete_job("test-job")
 
         # Check timing was recorded
         sampling_timings = tracker.stage_timings[GenerationStage.SAMPLING]
-        assert len(sampling_timings.samples) > 0
+        assert list(sampling_timings.samples) == [pytest.approx(0.01)]
 
     def test_calculate_percent_initializing(self, tracker, mock_workflow_progress):
         """Test percentage calculation in initializing stage"""
@@ -302,47 +335,57 @@ class TestProgressTracker:
         # Jobs should be independent
         assert len(tracker.active_jobs) == 2
 
-    def test_stage_mapping_node_names(self, tracker, mock_workflow_progress):
-        """Test stage detection from node names"""
-        tracker.start_job("test-job", "test-prompt", 20)
-
-        test_cases = [
+    @pytest.mark.parametrize(
+        "node_name,expected_stage",
+        [
             ("CheckpointLoader", GenerationStage.LOADING_MODELS),
             ("CLIPTextEncode", GenerationStage.ENCODING),
             ("KSampler", GenerationStage.SAMPLING),
             ("VAEDecode", GenerationStage.DECODING),
             ("SaveImage", GenerationStage.POST_PROCESSING),
-        ]
+        ],
+    )
+    def test_stage_mapping_node_names(
+        self, tracker, mock_workflow_progress, node_name, expected_stage
+    ):
+        """Test stage detection from node names"""
+        job_id = f"job-{node_name}"
+        tracker.start_job(job_id, "test-prompt", 20)
 
-        for node_name, expected_stage in test_cases:
-            wp = mock_workflow_progress(status=ExecutionStatus.RUNNING)
-            wp.node_name = node_name
+        wp = mock_workflow_progress(status=ExecutionStatus.RUNNING)
+        wp.current_node = "1"  # Node names are only consulted while a node is executing
+        wp.node_name = node_name
 
-            stage, _, _, _, _ = tracker.update_progress("test-job", wp)
-            assert stage == expected_stage
+        stage, _, _, _, _ = tracker.update_progress(job_id, wp)
+        assert stage == expected_stage
 
 
 class TestHistoricalTimings:
     """Test historical timing data usage"""
 
-    def test_timings_improve_estimates(self, tracker):
+    def test_timings_improve_estimates(self, tracker, fake_clock, mock_workflow_progress):
         """Test that historical data improves estimates"""
         # Get initial estimate
         initial_estimate = tracker.stage_timings[GenerationStage.SAMPLING].estimate()
 
+        sampling = mock_workflow_progress(status=ExecutionStatus.RUNNING, step=1)
+        sampling.current_node = "3"
+        sampling.node_name = "KSampler"
+
         # Add several samples
         for _ in range(5):
             tracker.start_job(f"job-{_}", f"prompt-{_}", 20)
+            tracker.update_progress(f"job-{_}", sampling)
 
             # Simulate fast execution
-            time.sleep(0.01)
+            fake_clock.advance(0.01)
             tracker.complete_job(f"job-{_}")
 
-        # New estimate should be different (and likely lower)
+        # New estimate should come from the recorded sampling times
         new_estimate = tracker.stage_timings[GenerationStage.SAMPLING].estimate()
 
-        # Estimates should differ (historical data is being used)
-        assert new_estimate != initial_estimate
+        assert new_estimate == pytest.approx(0.01)
+        assert new_estimate < initial_estimate
 
 
 if __name__ == "__main__":
@@ -0,0 +1,59 @@
+"""Shared fixtures for WS-13 MCP server tests"""
+
+import dataclasses
+import pickle
+
+import pytest
+
+from python.mcp_server.config_loader import load_config
+from python.mcp_server.tools import MCPTools
+
+
+@pytest.fixture(scope="session")
+def mcp_config():
+    """Default MCP configuration (shared and frozen)"""
+    return load_config()
+
+
+@pytest.fixture(scope="session")
+def mcp_config_pickle(mcp_config):
+    """Pickled snapshot of the default configuration, taken once"""
+    return pickle.dumps(mcp_config, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+@pytest.fixture
+def fresh_config(mcp_config_pickle):
+    """Private copy of the default configuration, sharing no nested objects
+
+    The config dataclasses are frozen, but their list and dict fields are
+    not; tests that touch those get their own copy without re-reading YAML.
+    """
+    return pickle.loads(mcp_config_pickle)
+
+
+@pytest.fixture
+def mcp_tools(mcp_config):
+    """MCP tools built from the shared default configuration
+
+    Function-scoped: MCPTools owns an asyncio.Lock, which must not outlive
+    the per-test event loop it is used on.
+    """
+    return MCPTools(mcp_config)
+
+
+@pytest.fixture
+def deploy_tools(fresh_config):
+    """MCP tools with Bevy structure validation disabled"""
+    config = dataclasses.replace(
+        fresh_config,
+        deployment=dataclasses.replace(fresh_config.deployment, validate_bevy_structure=False),
+    )
+    return MCPTools(config)
+
+
+@pytest.fixture(scope="module")
+def fake_png(tmp_path_factory):
+    """Path to a placeholder sprite file, written once per module"""
+    path = tmp_path_factory.mktemp("sprites") / "fake.png"
+    path.write_bytes(b"fake png data")
+    return str(path)
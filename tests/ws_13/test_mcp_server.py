@@ -8,19 +8,26 @@ Tests the MCP server implementation including:
 """
 
 import asyncio
+import dataclasses
 import json
+import logging
 import tempfile
-import shutil
 from pathlib import Path
 import sys
 
+import pytest
+
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from python.mcp_server import tools as tools_module
 from python.mcp_server.config_loader import load_config, Config
 from python.mcp_server.tools import MCPTools, ValidationError
 
+# Per-check progress; pass --log-cli-level=INFO to see it under pytest
+logger = logging.getLogger(__name__)
+
 
 class TestConfigLoader:
     """Test configuration loading"""
@@ -39,7 +46,7 @@ class TestConfigLoader:
         assert config.generation.default_resolution == "1024x1024"
         assert config.generation.default_steps == 30
 
-        print("✓ Config loader test passed")
+        logger.info("✓ Config loader test passed")
 
     def test_validation_config(self):
         """Test validation configuration"""
@@ -50,200 +57,193 @@ class TestConfigLoader:
         assert "1024x1024" in config.validation.allowed_resolutions
         assert "pixel_art" in config.validation.allowed_styles
 
-        print("✓ Validation config test passed")
+        logger.info("✓ Validation config test passed")
+
+    def test_load_config_cached(self):
+        """Test repeated loads reuse the parsed config"""
+        assert load_config() is load_config()
+
+    def test_fresh_config_independent(self, mcp_config, fresh_config):
+        """Test fresh configs match the default but share no nested state"""
+        assert fresh_config == mcp_config
+        assert fresh_config.validation.allowed_styles is not mcp_config.validation.allowed_styles
+        assert fresh_config.error_handling is not mcp_config.error_handling
+
+    def test_config_frozen(self, mcp_config):
+        """Test the shared config cannot be mutated in place"""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            mcp_config.deployment.validate_bevy_structure = False
 
 
 class TestToolsValidation:
     """Test tool parameter validation"""
 
-    def setup(self):
-        """Setup test fixtures"""
-        self.config = load_config()
-        self.tools = MCPTools(self.config)
-
-    async def test_validate_prompt(self):
+    def test_validate_prompt(self, mcp_tools):
         """Test prompt validation"""
-        self.setup()
-
         # Valid prompt
-        try:
-            self.tools._validate_prompt("valid prompt text")
-            print("✓ Valid prompt accepted")
-        except ValidationError:
-            assert False, "Valid prompt rejected"
+        mcp_tools._validate_prompt("valid prompt text")
+        logger.info("✓ Valid prompt accepted")
 
         # Empty prompt
-        try:
-            self.tools._validate_prompt("")
-            assert False, "Empty prompt should raise ValidationError"
-        except ValidationError as e:
-            assert e.field == "prompt"
-            print("✓ Empty prompt rejected")
+        with pytest.raises(ValidationError) as exc_info:
+            mcp_tools._validate_prompt("")
+        assert exc_info.value.field == "prompt"
+        logger.info("✓ Empty prompt rejected")
 
         # Too short
-        try:
-            self.tools._validate_prompt("ab")
-            assert False, "Too short prompt should raise ValidationError"
-        except ValidationError as e:
-            assert e.field == "prompt"
-            print("✓ Too short prompt rejected")
+        with pytest.raises(ValidationError) as exc_info:
+            mcp_tools._validate_prompt("ab")
+        assert exc_info.value.field == "prompt"
+        logger.info("✓ Too short prompt rejected")
 
         # Too long
-        try:
-            self.tools._validate_prompt("x" * 501)
-            assert False, "Too long prompt should raise ValidationError"
-        except ValidationError as e:
-            assert e.field == "prompt"
-            print("✓ Too long prompt rejected")
-
-    async def test_validate_resolution(self):
-        """Test resolution validation"""
-        self.setup()
+        with pytest.raises(ValidationError) as exc_info:
+            mcp_tools._validate_prompt("x" * 501)
+        assert exc_info.value.field == "prompt"
+        logger.info("✓ Too long prompt rejected")
 
+    def test_validate_resolution(self, mcp_tools):
+        """Test resolution validation"""
         # Valid resolution
-        size = self.tools._validate_resolution("1024x1024")
+        size = mcp_tools._validate_resolution("1024x1024")
         assert size == [1024, 1024]
-        print("✓ Valid resolution accepted")
+        logger.info("✓ Valid resolution accepted")
 
         # Invalid format
-        try:
-            self.tools._validate_resolution("1024")
-            assert False, "Invalid format should raise ValidationError"
-        except ValidationError as e:
-            assert e.field == "resolution"
-            print("✓ Invalid format rejected")
+        with pytest.raises(ValidationError) as exc_info:
+            mcp_tools._validate_resolution("1024")
+        assert exc_info.value.field == "resolution"
+        logger.info("✓ Invalid format rejected")
 
         # Not allowed
-        try:
-            self.tools._validate_resolution("256x256")
-            assert False, "Not allowed resolution should raise ValidationError"
-        except ValidationError as e:
-            assert e.field == "resolution"
-            print("✓ Not allowed resolution rejected")
-
-    async def test_validate_steps(self):
-        """Test steps validation"""
-        self.setup()
+        with pytest.raises(ValidationError) as exc_info:
+            mcp_tools._validate_resolution("256x256")
+        assert exc_info.value.field == "resolution"
+        logger.info("✓ Not allowed resolution rejected")
 
+    def test_validate_steps(self, mcp_tools):
+        """Test steps validation"""
         # Valid steps
-        try:
-            self.tools._validate_steps(30)
-            print("✓ Valid steps accepted")
-        except ValidationError:
-            assert False, "Valid steps rejected"
+        mcp_tools._validate_steps(30)
+        logger.info("✓ Valid steps accepted")
 
         # Too low
-        try:
-            self.tools._validate_steps(5)
-            assert False, "Too low steps should raise ValidationError"
-        except ValidationError as e:
-            assert e.field == "steps"
-            print("✓ Too low steps rejected")
+        with pytest.raises(ValidationError) as exc_info:
+            mcp_tools._validate_steps(5)
+        assert exc_info.value.field == "steps"
+        logger.info("✓ Too low steps rejected")
 
         # Too high
-        try:
-            self.tools._validate_steps(150)
-            assert False, "Too high steps should raise ValidationError"
-        except ValidationError as e:
-            assert e.field == "steps"
-            print("✓ Too high steps rejected")
-
-    async def test_validate_style(self):
-        """Test style validation"""
-        self.setup()
+        with pytest.raises(ValidationError) as exc_info:
+            mcp_tools._validate_steps(150)
+        assert exc_info.value.field == "steps"
+        logger.info("✓ Too high steps rejected")
 
+    def test_validate_style(self, mcp_tools):
+        """Test style validation"""
         # Valid style
-        try:
-            self.tools._validate_style("pixel_art")
-            print("✓ Valid style accepted")
-        except ValidationError:
-            assert False, "Valid style rejected"
+        mcp_tools._validate_style("pixel_art")
+        logger.info("✓ Valid style accepted")
 
         # Invalid style
-        try:
-            self.tools._validate_style("invalid_style")
-            assert False, "Invalid style should raise ValidationError"
-        except ValidationError as e:
-            assert e.field == "style"
-            print("✓ Invalid style rejected")
+        with pytest.raises(ValidationError) as exc_info:
+            mcp_tools._validate_style("invalid_style")
+        assert exc_info.value.field == "style"
+        logger.info("✓ Invalid style rejected")
 
 
+@pytest.mark.asyncio
 class TestDeployment:
     """Test deployment functionality"""
 
-    async def test_deploy_to_bevy(self):
+    async def test_deploy_to_bevy(self, deploy_tools, fake_png):
         """Test deploying sprite to Bevy assets"""
-        config = load_config()
-        # Disable validation for testing
-        config.deployment.validate_bevy_structure = False
-
-        tools = MCPTools(config)
-
-        # Create temporary files
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            tmp.write(b"fake png data")
-            sprite_path = tmp.name
-
-        temp_assets_dir = tempfile.mkdtemp()
-
-        try:
-            # Deploy sprite
-            result = await tools.deploy_to_bevy(
-                sprite_path=sprite_path,
-                bevy_assets_dir=temp_assets_dir,
-                sprite_name="test_sprite",
-                update_manifest=True,
+        tools = deploy_tools
+
+        with tempfile.TemporaryDirectory() as temp_assets_dir:
+            # Deploy two sprites concurrently; manifest updates must not race
+            result, result2 = await asyncio.gather(
+                tools.deploy_to_bevy(
+                    sprite_path=fake_png,
+                    bevy_assets_dir=temp_assets_dir,
+                    sprite_name="test_sprite",
+                    update_manifest=True,
+                ),
+                tools.deploy_to_bevy(
+                    sprite_path=fake_png,
+                    bevy_assets_dir=temp_assets_dir,
+                    sprite_name="test_sprite2",
+                    update_manifest=True,
+                ),
             )
 
             assert result["status"] == "success"
             assert result["manifest_updated"] is True
+            assert result2["status"] == "success"
 
-            # Check deployed file exists
-            deployed_path = Path(result["deployed_path"])
-            assert deployed_path.exists()
-            print("✓ Sprite deployed successfully")
+            # Check deployed files exist
+            assert Path(result["deployed_path"]).exists()
+            assert Path(result2["deployed_path"]).exists()
+            logger.info("✓ Sprites deployed successfully")
 
-            # Check manifest
-            manifest_path = Path(temp_assets_dir) / "asset_manifest.json"
-            assert manifest_path.exists()
+            # Each deploy returns the manifest as it wrote it
+            assert "test_sprite" in [s["name"] for s in result["manifest"]["sprites"]]
+            assert "test_sprite2" in [s["name"] for s in result2["manifest"]["sprites"]]
+            logger.info("✓ Manifest updated correctly by concurrent deploys")
 
+            # Durability check: the final manifest on disk holds both sprites
+            manifest_path = Path(temp_assets_dir) / "asset_manifest.json"
             with open(manifest_path) as f:
                 manifest = json.load(f)
 
-            assert "sprites" in manifest
-            assert len(manifest["sprites"]) == 1
-            assert manifest["sprites"][0]["name"] == "test_sprite"
-            print("✓ Manifest updated correctly")
+            assert sorted(s["name"] for s in manifest["sprites"]) == ["test_sprite", "test_sprite2"]
+            logger.info("✓ Manifest persisted to disk")
 
-            # Deploy another sprite (update manifest)
-            result2 = await tools.deploy_to_bevy(
-                sprite_path=sprite_path,
-                bevy_assets_dir=temp_assets_dir,
-                sprite_name="test_sprite2",
-                update_manifest=True,
-            )
+    async def test_manifest_single_write(self, deploy_tools, fake_png, monkeypatch):
+        """Test the manifest is written with one write() call"""
+        writes = []
 
-            assert result2["status"] == "success"
+        class CountingFile:
+            def __init__(self, f):
+                self._f = f
 
-            with open(manifest_path) as f:
-                manifest = json.load(f)
+            def write(self, data):
+                writes.append(data)
+                return self._f.write(data)
 
-            assert len(manifest["sprites"]) == 2
-            print("✓ Manifest append works correctly")
+            def __getattr__(self, name):
+                return getattr(self._f, name)
 
-        finally:
-            # Cleanup
-            Path(sprite_path).unlink(missing_ok=True)
-            shutil.rmtree(temp_assets_dir, ignore_errors=True)
+            def __enter__(self):
+                self._f.__enter__()
+                return self
 
-    async def test_deploy_nonexistent_file(self):
-        """Test deploying nonexistent file"""
-        config = load_config()
-        tools = MCPTools(config)
+            def __exit__(self, *exc):
+                return self._f.__exit__(*exc)
+
+        def counting_open(file, mode="r", *args, **kwargs):
+            f = open(file, mode, *args, **kwargs)
+            return CountingFile(f) if "w" in mode else f
 
-        temp_assets_dir = tempfile.mkdtemp()
+        monkeypatch.setattr(tools_module, "open", counting_open, raising=False)
 
-        try:
+        with tempfile.TemporaryDirectory() as temp_assets_dir:
+            result = await deploy_tools.deploy_to_bevy(
+                sprite_path=fake_png,
+                bevy_assets_dir=temp_assets_dir,
+                sprite_name="test_sprite",
+            )
+
+        assert result["manifest_updated"] is True
+        assert len(writes) == 1
+        assert json.loads(writes[0])["sprites"][0]["name"] == "test_sprite"
+        logger.info("✓ Manifest written in a single call")
+
+    async def test_deploy_nonexistent_file(self, mcp_tools):
+        """Test deploying nonexistent file"""
+        tools = mcp_tools
+
+        with tempfile.TemporaryDirectory() as temp_assets_dir:
             result = await tools.deploy_to_bevy(
                 sprite_path="/nonexistent/file.png",
                 bevy_assets_dir=temp_assets_dir,
@@ -252,10 +252,7 @@ class TestDeployment:
 
             assert result["status"] == "error"
             assert "not found" in result["error"].lower()
-            print("✓ Nonexistent file error handled correctly")
-
-        finally:
-            shutil.rmtree(temp_assets_dir, ignore_errors=True)
+            logger.info("✓ Nonexistent file error handled correctly")
 
 
 async def run_tests():
@@ -272,17 +269,26 @@ async def run_tests():
 
     # Validation tests
     print("\n[Test Suite] Parameter Validation")
+    config = load_config()
+    tools = MCPTools(config)
     validation_tests = TestToolsValidation()
-    await validation_tests.test_validate_prompt()
-    await validation_tests.test_validate_resolution()
-    await validation_tests.test_validate_steps()
-    await validation_tests.test_validate_style()
+    validation_tests.test_validate_prompt(tools)
+    validation_tests.test_validate_resolution(tools)
+    validation_tests.test_validate_steps(tools)
+    validation_tests.test_validate_style(tools)
 
     # Deployment tests
     print("\n[Test Suite] Deployment Functionality")
+    deploy_config = dataclasses.replace(
+        config,
+        deployment=dataclasses.replace(config.deployment, validate_bevy_structure=False),
+    )
     deployment_tests = TestDeployment()
-    await deployment_tests.test_deploy_to_bevy()
-    await deployment_tests.test_deploy_nonexistent_file()
+    with tempfile.TemporaryDirectory() as sprites_dir:
+        fake_png = Path(sprites_dir) / "fake.png"
+        fake_png.write_bytes(b"fake png data")
+        await deployment_tests.test_deploy_to_bevy(MCPTools(deploy_config), str(fake_png))
+    await deployment_tests.test_deploy_nonexistent_file(tools)
 
     print("\n" + "=" * 60)
     print("ALL TESTS PASSED ✓")
@@ -290,4 +296,12 @@ async def run_tests():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     asyncio.run(run_tests())
@@ -5,49 +5,166 @@ all dependencies to be installed.
 """
 
 from pathlib import Path
+import functools
+import logging
+import os
 import sys
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+MCP_SERVER_DIR = project_root / "python" / "mcp_server"
+CONFIG_DIR = project_root / "config"
+
+# Per-check progress is logged at INFO: quiet under pytest unless
+# --log-cli-level=INFO is passed, printed by run_all_tests()
+logger = logging.getLogger(__name__)
+
+
+REQUIRED_FILES = (
+    "__init__.py",
+    "__main__.py",
+    "server.py",
+    "config_loader.py",
+    "backend_client.py",
+    "tools.py",
+    "test_client.py",
+    "README.md",
+    "QUICKSTART.md",
+    "requirements.txt",
+)
+
+SERVER_CONTENTS = (
+    b"def start_server",
+    b"@mcp.tool()",
+    b"async def generate_sprite",
+    b"async def generate_batch",
+    b"async def deploy_to_bevy",
+    b"from fastmcp import FastMCP",
+)
+
+TOOLS_CONTENTS = (
+    b"class MCPTools",
+    b"class ValidationError",
+    b"async def generate_sprite",
+    b"async def generate_batch",
+    b"async def deploy_to_bevy",
+    b"def _validate_prompt",
+    b"def _validate_resolution",
+)
+
+CONFIG_LOADER_CONTENTS = (
+    b"class MCPServerConfig",
+    b"class BackendConfig",
+    b"class GenerationConfig",
+    b"class DeploymentConfig",
+    b"class ValidationConfig",
+    b"def load_config",
+)
+
+BACKEND_CLIENT_CONTENTS = (
+    b"class BackendClient",
+    b"async def connect",
+    b"async def ping",
+    b"async def get_status",
+    b"async def generate_sprite",
+    b"async def list_models",
+)
+
+CONFIG_SECTIONS = (
+    b"mcp_server:",
+    b"backend:",
+    b"generation:",
+    b"deployment:",
+    b"validation:",
+    b"error_handling:",
+    b"logging:",
+    b"performance:",
+)
+
+CONFIG_SETTINGS = (
+    b"zmq_endpoint:",
+    b"comfyui_url:",
+    b"default_workflow:",
+    b"bevy_assets_base:",
+    b"allowed_resolutions:",
+    b"allowed_styles:",
+)
+
+README_SECTIONS = (
+    b"# DGX-Pixels FastMCP Server",
+    b"## Installation",
+    b"## Configuration",
+    b"## Usage",
+    b"## MCP Tools",
+    b"### 1. generate_sprite",
+    b"### 2. generate_batch",
+    b"### 3. deploy_to_bevy",
+    b"## Testing",
+    b"## Troubleshooting",
+)
+
+QUICKSTART_SECTIONS = (
+    b"# FastMCP Server - Quick Start Guide",
+    b"## Prerequisites",
+    b"## Step 1: Install Dependencies",
+    b"## Step 2: Configure the Server",
+    b"## Step 3: Start Backend Services",
+    b"## Common Issues",
+)
+
+BACKEND_CLIENT_IMPORTS = (
+    b"from message_protocol import",
+    b"GenerateRequest",
+    b"CancelRequest",
+    b"ListModelsRequest",
+    b"StatusRequest",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _read(path: Path) -> bytes:
+    """Read a file once per session; several tests inspect the same sources
+
+    Returned undecoded: every expected substring is ASCII, so searching the
+    raw bytes gives the same answer without a UTF-8 decode pass.
+    """
+    return path.read_bytes()
+
+
+def _missing(data: bytes, expected: tuple) -> list:
+    """Return the expected substrings absent from data, decoded for reporting"""
+    return [e.decode() for e in expected if e not in data]
+
 
 def test_directory_structure():
     """Test that all required files exist"""
-    print("\n[Test] Directory Structure")
-
-    mcp_server_dir = project_root / "python" / "mcp_server"
-    config_dir = project_root / "config"
-
-    required_files = [
-        mcp_server_dir / "__init__.py",
-        mcp_server_dir / "__main__.py",
-        mcp_server_dir / "server.py",
-        mcp_server_dir / "config_loader.py",
-        mcp_server_dir / "backend_client.py",
-        mcp_server_dir / "tools.py",
-        mcp_server_dir / "test_client.py",
-        mcp_server_dir / "README.md",
-        mcp_server_dir / "QUICKSTART.md",
-        mcp_server_dir / "requirements.txt",
-        config_dir / "mcp_config.yaml",
-    ]
+    logger.info("\n[Test] Directory Structure")
+
+    # One directory listing instead of a stat() per file
+    with os.scandir(MCP_SERVER_DIR) as entries:
+        present = {entry.name for entry in entries}
 
-    for file_path in required_files:
-        if not file_path.exists():
-            print(f"  ✗ Missing: {file_path}")
+    for filename in REQUIRED_FILES:
+        if filename not in present:
+            logger.error("  ✗ Missing: %s", MCP_SERVER_DIR / filename)
             return False
-        print(f"  ✓ Found: {file_path.name}")
+        logger.info("  ✓ Found: %s", filename)
 
-    print("  ✓ All required files present")
+    config_path = CONFIG_DIR / "mcp_config.yaml"
+    if not config_path.exists():
+        logger.error("  ✗ Missing: %s", config_path)
+        return False
+    logger.info("  ✓ Found: %s", config_path.name)
+
+    logger.info("  ✓ All required files present")
     return True
 
 
 def test_file_sizes():
     """Test that files have content"""
-    print("\n[Test] File Sizes")
-
-    mcp_server_dir = project_root / "python" / "mcp_server"
+    logger.info("\n[Test] File Sizes")
 
     files_to_check = {
         "server.py": 8000,  # Main server, should be substantial
@@ -57,229 +174,138 @@ def test_file_sizes():
         "README.md": 9000,  # Documentation
     }
 
+    # Size files from one directory listing; DirEntry caches its stat result
+    with os.scandir(MCP_SERVER_DIR) as entries:
+        sizes = {entry.name: entry.stat().st_size for entry in entries if entry.is_file()}
+
     for filename, min_size in files_to_check.items():
-        file_path = mcp_server_dir / filename
-        actual_size = file_path.stat().st_size
+        actual_size = sizes.get(filename, 0)
 
         if actual_size < min_size:
-            print(
-                f"  ✗ {filename}: {actual_size} bytes (expected >{min_size})"
+            logger.error(
+                "  ✗ %s: %s bytes (expected >%s)", filename, actual_size, min_size
             )
             return False
 
-        print(f"  ✓ {filename}: {actual_size} bytes")
+        logger.info("  ✓ %s: %s bytes", filename, actual_size)
 
-    print("  ✓ All files have expected content")
+    logger.info("  ✓ All files have expected content")
     return True
 
 
 def test_code_structure():
     """Test that Python files have expected structure"""
-    print("\n[Test] Code Structure")
-
-    mcp_server_dir = project_root / "python" / "mcp_server"
+    logger.info("\n[Test] Code Structure")
 
     # Test server.py has expected functions
-    server_py = (mcp_server_dir / "server.py").read_text()
-    expected_server_contents = [
-        "def start_server",
-        "@mcp.tool()",
-        "async def generate_sprite",
-        "async def generate_batch",
-        "async def deploy_to_bevy",
-        "from fastmcp import FastMCP",
-    ]
-
-    for expected in expected_server_contents:
-        if expected not in server_py:
-            print(f"  ✗ server.py missing: {expected}")
-            return False
+    server_py = _read(MCP_SERVER_DIR / "server.py")
+    missing = _missing(server_py, SERVER_CONTENTS)
+    if missing:
+        logger.error("  ✗ server.py missing: %s", ", ".join(missing))
+        return False
 
-    print("  ✓ server.py has expected structure")
+    logger.info("  ✓ server.py has expected structure")
 
     # Test tools.py has expected classes
-    tools_py = (mcp_server_dir / "tools.py").read_text()
-    expected_tools_contents = [
-        "class MCPTools",
-        "class ValidationError",
-        "async def generate_sprite",
-        "async def generate_batch",
-        "async def deploy_to_bevy",
-        "def _validate_prompt",
-        "def _validate_resolution",
-    ]
-
-    for expected in expected_tools_contents:
-        if expected not in tools_py:
-            print(f"  ✗ tools.py missing: {expected}")
-            return False
+    tools_py = _read(MCP_SERVER_DIR / "tools.py")
+    missing = _missing(tools_py, TOOLS_CONTENTS)
+    if missing:
+        logger.error("  ✗ tools.py missing: %s", ", ".join(missing))
+        return False
 
-    print("  ✓ tools.py has expected structure")
+    logger.info("  ✓ tools.py has expected structure")
 
     # Test config_loader.py has expected classes
-    config_py = (mcp_server_dir / "config_loader.py").read_text()
-    expected_config_contents = [
-        "class MCPServerConfig",
-        "class BackendConfig",
-        "class GenerationConfig",
-        "class DeploymentConfig",
-        "class ValidationConfig",
-        "def load_config",
-    ]
-
-    for expected in expected_config_contents:
-        if expected not in config_py:
-            print(f"  ✗ config_loader.py missing: {expected}")
-            return False
+    config_py = _read(MCP_SERVER_DIR / "config_loader.py")
+    missing = _missing(config_py, CONFIG_LOADER_CONTENTS)
+    if missing:
+        logger.error("  ✗ config_loader.py missing: %s", ", ".join(missing))
+        return False
 
-    print("  ✓ config_loader.py has expected structure")
+    logger.info("  ✓ config_loader.py has expected structure")
 
     # Test backend_client.py has expected classes
-    backend_py = (mcp_server_dir / "backend_client.py").read_text()
-    expected_backend_contents = [
-        "class BackendClient",
-        "async def connect",
-        "async def ping",
-        "async def get_status",
-        "async def generate_sprite",
-        "async def list_models",
-    ]
-
-    for expected in expected_backend_contents:
-        if expected not in backend_py:
-            print(f"  ✗ backend_client.py missing: {expected}")
-            return False
+    backend_py = _read(MCP_SERVER_DIR / "backend_client.py")
+    missing = _missing(backend_py, BACKEND_CLIENT_CONTENTS)
+    if missing:
+        logger.error("  ✗ backend_client.py missing: %s", ", ".join(missing))
+        return False
 
-    print("  ✓ backend_client.py has expected structure")
+    logger.info("  ✓ backend_client.py has expected structure")
 
-    print("  ✓ All code files have expected structure")
+    logger.info("  ✓ All code files have expected structure")
     return True
 
 
 def test_configuration():
     """Test configuration file"""
-    print("\n[Test] Configuration File")
-
-    config_path = project_root / "config" / "mcp_config.yaml"
-    config_content = config_path.read_text()
-
-    expected_config_sections = [
-        "mcp_server:",
-        "backend:",
-        "generation:",
-        "deployment:",
-        "validation:",
-        "error_handling:",
-        "logging:",
-        "performance:",
-    ]
+    logger.info("\n[Test] Configuration File")
 
-    for section in expected_config_sections:
-        if section not in config_content:
-            print(f"  ✗ Missing config section: {section}")
-            return False
+    config_path = CONFIG_DIR / "mcp_config.yaml"
+    config_content = _read(config_path)
+    missing = _missing(config_content, CONFIG_SECTIONS)
+    if missing:
+        logger.error("  ✗ Missing config section: %s", ", ".join(missing))
+        return False
 
-    print(f"  ✓ Configuration file has all sections")
+    logger.info("  ✓ Configuration file has all sections")
 
     # Check specific settings
-    expected_settings = [
-        "zmq_endpoint:",
-        "comfyui_url:",
-        "default_workflow:",
-        "bevy_assets_base:",
-        "allowed_resolutions:",
-        "allowed_styles:",
-    ]
-
-    for setting in expected_settings:
-        if setting not in config_content:
-            print(f"  ✗ Missing setting: {setting}")
-            return False
+    missing = _missing(config_content, CONFIG_SETTINGS)
+    if missing:
+        logger.error("  ✗ Missing setting: %s", ", ".join(missing))
+        return False
 
-    print(f"  ✓ Configuration has all required settings")
+    logger.info("  ✓ Configuration has all required settings")
     return True
 
 
 def test_documentation():
     """Test documentation files"""
-    print("\n[Test] Documentation")
-
-    mcp_server_dir = project_root / "python" / "mcp_server"
-
-    readme = (mcp_server_dir / "README.md").read_text()
-    expected_readme_sections = [
-        "# DGX-Pixels FastMCP Server",
-        "## Installation",
-        "## Configuration",
-        "## Usage",
-        "## MCP Tools",
-        "### 1. generate_sprite",
-        "### 2. generate_batch",
-        "### 3. deploy_to_bevy",
-        "## Testing",
-        "## Troubleshooting",
-    ]
-
-    for section in expected_readme_sections:
-        if section not in readme:
-            print(f"  ✗ README missing section: {section}")
-            return False
+    logger.info("\n[Test] Documentation")
 
-    print("  ✓ README.md has all expected sections")
+    readme = _read(MCP_SERVER_DIR / "README.md")
+    missing = _missing(readme, README_SECTIONS)
+    if missing:
+        logger.error("  ✗ README missing section: %s", ", ".join(missing))
+        return False
 
-    quickstart = (mcp_server_dir / "QUICKSTART.md").read_text()
-    expected_quickstart_sections = [
-        "# FastMCP Server - Quick Start Guide",
-        "## Prerequisites",
-        "## Step 1: Install Dependencies",
-        "## Step 2: Configure the Server",
-        "## Step 3: Start Backend Services",
-        "## Common Issues",
-    ]
+    logger.info("  ✓ README.md has all expected sections")
 
-    for section in expected_quickstart_sections:
-        if section not in quickstart:
-            print(f"  ✗ QUICKSTART missing section: {section}")
-            return False
+    quickstart = _read(MCP_SERVER_DIR / "QUICKSTART.md")
+    missing = _missing(quickstart, QUICKSTART_SECTIONS)
+    if missing:
+        logger.error("  ✗ QUICKSTART missing section: %s", ", ".join(missing))
+        return False
 
-    print("  ✓ QUICKSTART.md has all expected sections")
+    logger.info("  ✓ QUICKSTART.md has all expected sections")
     return True
 
 
 def test_integration_points():
     """Test that integration points are properly referenced"""
-    print("\n[Test] Integration Points")
-
-    mcp_server_dir = project_root / "python" / "mcp_server"
+    logger.info("\n[Test] Integration Points")
 
     # Check backend_client imports from workers
-    backend_client = (mcp_server_dir / "backend_client.py").read_text()
-    expected_imports = [
-        "from message_protocol import",
-        "GenerateRequest",
-        "CancelRequest",
-        "ListModelsRequest",
-        "StatusRequest",
-    ]
-
-    for expected in expected_imports:
-        if expected not in backend_client:
-            print(f"  ✗ backend_client missing import: {expected}")
-            return False
+    backend_client = _read(MCP_SERVER_DIR / "backend_client.py")
+    missing = _missing(backend_client, BACKEND_CLIENT_IMPORTS)
+    if missing:
+        logger.error("  ✗ backend_client missing import: %s", ", ".join(missing))
+        return False
 
-    print("  ✓ Backend client properly imports from workers")
+    logger.info("  ✓ Backend client properly imports from workers")
 
     # Check server imports tools and config
-    server = (mcp_server_dir / "server.py").read_text()
-    if "from .config_loader import load_config" not in server:
-        print("  ✗ server.py doesn't import config_loader")
+    server = _read(MCP_SERVER_DIR / "server.py")
+    if b"from .config_loader import load_config" not in server:
+        logger.error("  ✗ server.py doesn't import config_loader")
         return False
 
-    if "from .tools import MCPTools" not in server:
-        print("  ✗ server.py doesn't import MCPTools")
+    if b"from .tools import MCPTools" not in server:
+        logger.error("  ✗ server.py doesn't import MCPTools")
         return False
 
-    print("  ✓ Server properly imports dependencies")
+    logger.info("  ✓ Server properly imports dependencies")
     return True
 
 
@@ -298,18 +324,29 @@ def run_all_tests():
         test_integration_points,
     ]
 
+    # Route per-check progress to stdout for this run only
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    previous_level = logger.level
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
     passed = 0
     failed = 0
 
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-            else:
+    try:
+        for test in tests:
+            try:
+                if test():
+                    passed += 1
+                else:
+                    failed += 1
+            except Exception as e:
+                print(f"  ✗ Test failed with exception: {e}")
                 failed += 1
-        except Exception as e:
-            print(f"  ✗ Test failed with exception: {e}")
-            failed += 1
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(previous_level)
 
     print("\n" + "=" * 60)
     print(f"Results: {passed} passed, {failed} failed")